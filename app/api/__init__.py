@@ -1,3 +1,5 @@
+import os
+from functools import lru_cache
 from pathlib import Path
 
 from fastapi import APIRouter
@@ -9,12 +11,24 @@ download_form_browser_url_prefix = "download-form-browser"
 router = APIRouter(prefix="/api")
 
 
+@lru_cache(maxsize=64)
+def static_file_stat(path: str | Path) -> os.stat_result:
+    """Stat a bundled static asset once; these files do not change while running."""
+    return os.stat(path)
+
+
 def return_file_response(
     path: str | Path,
     media_type: str = None,
     filename: str = None,
     status_code: int = 200,
+    static: bool = False,
 ):
     return FileResponse(
-        path=path, media_type=media_type, filename=filename, status_code=status_code
+        path=path,
+        media_type=media_type,
+        filename=filename,
+        status_code=status_code,
+        # FileResponse stats the file itself unless it is handed a stat result
+        stat_result=static_file_stat(path) if static else None,
     )
@@ -1,7 +1,7 @@
 from app.api import auth_url_prefix, router
 from app.core.exceptions import BusinessException
 from app.core.i18n import _
-from app.core.response import ok
+from app.core.response import json_response, ok
 from app.schemas.user_schema import UserLogin
 
 
@@ -15,10 +15,12 @@ async def login_api(user_login: UserLogin):
             http_status=401,
         )
 
-    return ok(
-        {
-            "access_token": "...",
-            "refresh_token": "...",
-            "expires_in": 900,
-        }
+    return json_response(
+        ok(
+            {
+                "access_token": "...",
+                "refresh_token": "...",
+                "expires_in": 900,
+            }
+        )
     )
@@ -6,7 +6,23 @@ from app.ui.pages import console
 from app.ui.pages import login, browser, profile, share
 
 
+def redirect_to_index(prefix: str):
+    """Build a handler that redirects a page's base route to its index page."""
+
+    def redirect():
+        return RedirectResponse(f"{prefix}/")
+
+    return redirect
+
+
 def setup_routes():
+    # Root and bare page prefixes all redirect to an index page, registered in one place
+    app.add_api_route("/", redirect_to_index(browser.this_page_routes))
+    for page in (login, browser, share, profile, console):
+        app.add_api_route(
+            page.this_page_routes, redirect_to_index(page.this_page_routes)
+        )
+
     app.include_router(login.router)
     app.include_router(browser.router)
     app.include_router(share.router)
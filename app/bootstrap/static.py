@@ -38,6 +38,6 @@ def setup_static():
             app.add_api_route(
                 f"/{filename}",
                 lambda f=filename, m=media_type: return_file_response(
-                    STATIC_DIR / f, media_type=m
+                    STATIC_DIR / f, media_type=m, static=True
                 ),
             )
@@ -59,6 +59,10 @@ class Config(BaseSettings):
     NOTIFY_DURATION: ClassVar[int] = 3000
     MULTIPARTPARSER_SPOOL_MAX_SIZE: ClassVar[int] = 1024 * 1024 * 5
     STREAM_CHUNK_SIZE: ClassVar[int] = 1024 * 10
+    UPLOAD_RETRY_ATTEMPTS: ClassVar[int] = 3
+    LIST_FILES_CACHE_TTL: ClassVar[float] = 10
+    LIST_FILES_CACHE_MAXSIZE: ClassVar[int] = 256
+    DIRECTORY_SIZE_WORKERS: ClassVar[int] = 8
 
     USE_MISANS: ClassVar[bool] = False
 
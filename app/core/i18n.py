@@ -1,4 +1,6 @@
 import gettext
+from contextvars import ContextVar
+from functools import lru_cache
 
 from nicegui import app
 
@@ -127,65 +129,122 @@ LANGUAGE_MAP = {
 
 APP_DEFAULT_LANGUAGE = settings.APP_DEFAULT_LANGUAGE.replace("-", "_")
 
-# List of supported languages loaded from the locales directory.
-SUPPORTED_LANGUAGES = [item.name for item in LOCALES_DIR.iterdir() if item.is_dir()]
-SUPPORTED_LANGUAGES_MAP = {
-    lang_code: LANGUAGE_MAP.get(lang_code, lang_code)
-    for lang_code in SUPPORTED_LANGUAGES
-}
-logger.debug(f"Supported languages: {SUPPORTED_LANGUAGES}")
 
-# Dictionary to hold Translation objects for each supported language.
+@lru_cache(maxsize=1)
+def get_supported_languages() -> tuple[str, ...]:
+    """
+    Return the language codes that have a folder in the locales directory.
+
+    The directory is scanned on first use instead of at import time.
+    """
+    languages = tuple(item.name for item in LOCALES_DIR.iterdir() if item.is_dir())
+    logger.debug("Supported languages: %s", languages)
+    return languages
+
+
+@lru_cache(maxsize=1)
+def get_supported_languages_map() -> dict[str, str]:
+    """Return a mapping of supported language codes to their display names."""
+    return {
+        lang_code: LANGUAGE_MAP.get(lang_code, lang_code)
+        for lang_code in get_supported_languages()
+    }
+
+
+# Dictionary to hold Translation objects, filled as languages are first requested.
 translations = {}
 
 
-def load_translations(
-    localedir=LOCALES_DIR, domain="messages", supported_languages=None
-):
+def load_translation(lang_code: str, localedir=LOCALES_DIR, domain="messages"):
+    """
+    Load and store the Translation object for a single language.
+
+    If the translation file is missing, a warning is logged and a NullTranslations
+    object is stored instead so the original message is returned.
+    """
+    try:
+        # Create a Translation object for the specific language.
+        t = gettext.translation(domain, localedir=localedir, languages=[lang_code])
+    except FileNotFoundError:
+        logger.warning(f"Translation file not found for language: {lang_code}")
+        t = gettext.NullTranslations()
+    translations[lang_code] = t
+    return t
+
+
+def get_translator(lang_code: str):
+    """
+    Return the Translation object for a language, loading its catalogue on first use.
+
+    Returns None for languages that are not shipped in the locales directory.
+    """
+    translator = translations.get(lang_code)
+    if translator is None and lang_code in get_supported_languages():
+        translator = load_translation(lang_code)
+    return translator
+
+
+# Language bound to the current request context, set once per HTTP request.
+current_language: ContextVar[str | None] = ContextVar("current_language", default=None)
+
+
+def set_current_language(lang_code: str | None) -> None:
+    """
+    Bind the user's language to the current context.
+
+    Code running in the same request (such as page construction) then resolves the
+    language without going through NiceGUI's user storage.
     """
-    Load Translation objects for all supported languages into a dictionary.
+    current_language.set(lang_code)
+
 
-    This function iterates over the list of supported languages and attempts to
-    load the corresponding .mo translation files using Python's built-in gettext module.
-    If a translation file is missing for a language, a warning is logged and a
-    NullTranslations object is used as a fallback to return the original message.
+def get_current_language() -> str:
     """
-    if supported_languages is None:
-        supported_languages = SUPPORTED_LANGUAGES
-    for lang_code in supported_languages:
-        try:
-            # Create a Translation object for the specific language.
-            t = gettext.translation(domain, localedir=localedir, languages=[lang_code])
-            translations[lang_code] = t
-        except FileNotFoundError:
-            logger.warning(f"Translation file not found for language: {lang_code}")
-            translations[lang_code] = gettext.NullTranslations()
+    Return the language code of the current user.
 
+    The language bound to the current context is used when available; otherwise it
+    is read from NiceGUI's user storage (e.g., in websocket event handlers). If that
+    fails (e.g., during application startup), the application's default language is
+    returned.
+    """
+    lang_code = current_language.get()
+    if lang_code is not None:
+        return lang_code
 
-load_translations()
+    try:
+        # Retrieve the user's selected language from NiceGUI user storage.
+        return app.storage.user.get("default_lang", APP_DEFAULT_LANGUAGE)
+    except RuntimeError:
+        # Fallback to the default language during early initialization.
+        return APP_DEFAULT_LANGUAGE
 
 
 def dynamic_gettext(message: str, lang_code: str = None) -> str:
     """
     Return the translated version of a message based on the specified or current user language.
 
-    If no language code is provided, this function attempts to retrieve the user's preferred
-    language from NiceGUI's user storage. If that fails (e.g., during application startup),
-    it falls back to the application's default language.
+    If no language code is provided, the current user's language is resolved via
+    `get_current_language()`.
 
     If a valid Translation object exists for the resolved language, the message is translated.
     Otherwise, the original message is returned unchanged.
     """
     if lang_code is None:
-        try:
-            # Retrieve the user's selected language from NiceGUI user storage.
-            lang_code = app.storage.user.get("default_lang", APP_DEFAULT_LANGUAGE)
-        except RuntimeError:
-            # Fallback to the default language during early initialization.
-            lang_code = APP_DEFAULT_LANGUAGE
-
-    # Fetch the corresponding translator for the resolved language code.
-    translator = translations.get(lang_code)
+        lang_code = get_current_language()
+
+    return translate(lang_code, message)
+
+
+@lru_cache(maxsize=4096)
+def translate(lang_code: str, message: str) -> str:
+    """
+    Translate a message into the given language, memoizing the result.
+
+    Catalogues are immutable once loaded, so each (language, message) pair only
+    has to be looked up once.
+    """
+    # Fetch the corresponding translator for the language code.
+    translator = get_translator(lang_code)
 
     if translator:
         # Translate the message using the loaded catalog.
@@ -1,13 +1,21 @@
+import atexit
 import json
 import logging
+import queue
 import time
+from datetime import datetime, timezone
+from functools import lru_cache
 from logging import StreamHandler
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Installed with NiceGUI, except on 32-bit x86 and PyPy
+    orjson = None
+
 from app.config import settings
 from app.core.paths import LOG_DIR, APP_ROOT
-from app.utils.time import utc_now
 
 # Logging configuration constants
 LOG_MAX_BYTES = 10 * 1024 * 1024  # 10 MB per log file
@@ -19,6 +27,16 @@ TIME_FORMAT = "%Y-%m-%d %H:%M:%S %Z"
 SUPPRESS_LOGGERS = ["python_multipart.multipart", "aiosqlite"]
 
 
+def dumps_log_record(log_record: dict) -> str:
+    """Serialize a log record to JSON, using orjson when it is available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(log_record, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits, which json handles
+    return json.dumps(log_record, ensure_ascii=False)
+
+
 class JsonFormatter(logging.Formatter):
     """
     Custom formatter that outputs log records as structured JSON.
@@ -32,21 +50,28 @@ class JsonFormatter(logging.Formatter):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.base_dir = APP_ROOT.resolve()
+        # Source paths are few and fixed; resolve each one only once
+        self.relative_path = lru_cache(maxsize=1024)(self._relative_path)
 
-    def format(self, record: logging.LogRecord) -> str:
+    def _relative_path(self, pathname: str, filename: str) -> str:
         # Resolve absolute path and compute relative path to project root
-        file_path = Path(record.pathname).resolve()
+        file_path = Path(pathname).resolve()
         try:
-            rel_path = str(file_path.relative_to(self.base_dir))
+            return str(file_path.relative_to(self.base_dir))
         except (ValueError, RuntimeError):
-            rel_path = record.filename  # fallback if not under project root
+            return filename  # fallback if not under project root
+
+    def format(self, record: logging.LogRecord) -> str:
+        # Stamp with the record's creation time: formatting runs later, on the
+        # queue listener thread
+        created_at = datetime.fromtimestamp(record.created, timezone.utc)
 
         # Build structured log entry
         log_record = {
-            "time": utc_now().strftime(TIME_FORMAT),
+            "time": f"{created_at.isoformat(sep=' ', timespec='seconds')[:19]} UTC",
             "level": record.levelname,
             "logger": record.name,
-            "file": rel_path,
+            "file": self.relative_path(record.pathname, record.filename),
             "line": record.lineno,
         }
 
@@ -64,7 +89,19 @@ class JsonFormatter(logging.Formatter):
                 else record.exc_text
             )
 
-        return json.dumps(log_record, ensure_ascii=False)
+        return dumps_log_record(log_record)
+
+
+class LocalQueueHandler(QueueHandler):
+    """
+    Queue handler for a listener running in the same process.
+
+    Records are enqueued untouched, so dict messages and exception info still reach
+    JsonFormatter; formatting and I/O happen on the listener thread instead.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
 
 
 def create_file_handler(
@@ -90,6 +127,8 @@ def setup_logging() -> logging.Logger:
 
     - Sets log level based on DEBUG mode or explicit LOG_LEVEL setting.
     - Adds both JSON-formatted file output and human-readable console output.
+    - Hands records to those outputs through a queue drained by a background thread,
+      so logging callers never block on formatting or disk writes.
     - Suppresses verbose logs from third-party modules listed in SUPPRESS_LOGGERS.
     - Marks the logger as initialized to prevent reconfiguration.
     """
@@ -124,9 +163,14 @@ def setup_logging() -> logging.Logger:
     for name in SUPPRESS_LOGGERS:
         logging.getLogger(name).setLevel(logging.ERROR)
 
-    # Attach handlers
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    # Attach handlers behind a queue; the listener thread does the actual output
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    root_logger.addHandler(LocalQueueHandler(log_queue))
 
     # Mark as initialized
     root_logger._initialized = True
@@ -1,6 +1,6 @@
 from typing import Generic, Optional, TypeVar
 
-from fastapi import HTTPException
+from fastapi import HTTPException, Response
 from pydantic import BaseModel
 
 T = TypeVar("T")
@@ -16,6 +16,15 @@ def ok(data=None, message: str = "OK") -> APIResponse:
     return APIResponse(code=0, message=message, data=data)
 
 
+def json_response(content: APIResponse, status_code: int = 200) -> Response:
+    # Serialize in pydantic-core instead of model_dump() followed by json.dumps
+    return Response(
+        content=content.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
 def fail(
     *,
     code: int,
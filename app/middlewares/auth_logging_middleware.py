@@ -5,6 +5,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import RedirectResponse
 
+from app.core.i18n import set_current_language
 from app.core.logging import logger
 from app.security.routes import is_route_unrestricted
 
@@ -60,6 +61,7 @@ class AuthLoggingMiddleware(BaseHTTPMiddleware):
         # Set the language
         if "default_lang" not in app.storage.user:
             app.storage.user["default_lang"] = self.get_browser_language(request)
+        set_current_language(app.storage.user["default_lang"])
 
         # Check authentication state from NiceGUI user storage
         user_storage = app.storage.user
@@ -4,20 +4,20 @@ from fastapi.responses import JSONResponse
 
 from app.core.exceptions import BusinessException
 from app.core.logging import logger
-from app.core.response import APIResponse
+from app.core.response import APIResponse, json_response
 
 
 async def business_exception_handler(
     request: Request,
     exc: BusinessException,
 ):
-    return JSONResponse(
-        status_code=exc.http_status,
-        content=APIResponse(
+    return json_response(
+        APIResponse(
             code=exc.code,
             message=exc.message,
             data=None,
-        ).model_dump(),
+        ),
+        status_code=exc.http_status,
     )
 
 
@@ -33,13 +33,13 @@ async def http_exception_handler(
             content=detail,
         )
 
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=APIResponse(
+    return json_response(
+        APIResponse(
             code=exc.status_code,
             message=str(detail),
             data=None,
-        ).model_dump(),
+        ),
+        status_code=exc.status_code,
     )
 
 
@@ -49,11 +49,11 @@ async def unhandled_exception_handler(
 ):
     logger.exception("Unhandled exception", exc_info=exc)
 
-    return JSONResponse(
-        status_code=500,
-        content=APIResponse(
+    return json_response(
+        APIResponse(
             code=9000,
             message="Internal server error",
             data=None,
-        ).model_dump(),
+        ),
+        status_code=500,
     )
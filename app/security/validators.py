@@ -1,6 +1,7 @@
 import re
 
 EMAIL_REGEX = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+EMAIL_PATTERN = re.compile(EMAIL_REGEX)
 
 
 def is_valid_email(email: str) -> bool:
@@ -13,4 +14,4 @@ def is_valid_email(email: str) -> bool:
     Returns:
         True if the email matches the standard format; False otherwise.
     """
-    return bool(re.fullmatch(EMAIL_REGEX, email))
+    return EMAIL_PATTERN.fullmatch(email) is not None
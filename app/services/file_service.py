@@ -1,7 +1,10 @@
 import asyncio
+import os
 import sys
 import tarfile
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from numbers import Number
 from pathlib import Path
 from typing import (
@@ -38,26 +41,15 @@ from app.utils.size import bytes_to_human_readable
 # storage_key = "temp_public_download_key"
 
 
-def get_file_icon(type_: str, extension: str):
-    if type_ == "dir":
-        return "📁"  # Folder
-    if not extension:
-        return "❓"
-    if not extension.strip():
-        return "❓"
-    else:
-        extension = extension.replace(".", "").lower()
-
-        # --- Documents / Text Files ---
-        if extension in ["txt", "md", "log", "cfg", "ini", "conf"]:
-            return "📄"
-        elif extension in ["doc", "docx", "odt", "rtf"]:
-            return "📝"
-        elif extension == "pdf":
-            return "📕"
-
-        # --- Code / Scripts ---
-        elif extension in [
+# Icon for each known file extension (lowercase, without the dot)
+FILE_ICONS = {
+    # --- Documents / Text Files ---
+    **dict.fromkeys(["txt", "md", "log", "cfg", "ini", "conf"], "📄"),
+    **dict.fromkeys(["doc", "docx", "odt", "rtf"], "📝"),
+    "pdf": "📕",
+    # --- Code / Scripts ---
+    **dict.fromkeys(
+        [
             "py",
             "js",
             "ts",
@@ -79,52 +71,57 @@ def get_file_icon(type_: str, extension: str):
             "php",
             "sh",
             "bat",
-        ]:
-            return "📜"
-
-        # --- Archives / Compressed Files ---
-        elif extension in ["zip", "rar", "7z", "tar", "gz", "bz2", "xz", "iso"]:
-            return "📦"
-
-        # --- Images ---
-        elif extension in [
-            "jpg",
-            "jpeg",
-            "png",
-            "gif",
-            "svg",
-            "ico",
-            "bmp",
-            "webp",
-            "tiff",
-        ]:
-            return "🖼️"
-
-        # --- Media Files ---
-        elif extension in ["mp4", "avi", "mov", "wmv", "flv", "mkv"]:
-            return "🎬"
-        elif extension in ["mp3", "wav", "flac", "ogg", "aac", "m4a"]:
-            return "🎵"
-
-        # --- Office / Data Files ---
-        elif extension in ["xls", "xlsx", "csv", "ods"]:
-            return "📈"
-        elif extension in ["ppt", "pptx", "odp"]:
-            return "🖥️"
-        elif extension in ["db", "sqlite", "mdb", "accdb"]:
-            return "🗃️"
-
-        # --- Executables / System Files ---
-        elif extension in ["exe", "dll", "msi", "app", "apk", "dmg"]:
-            return "⚙️"
-
-        # --- Font Files ---
-        elif extension in ["ttf", "otf", "woff", "woff2"]:
-            return "🅰️"
-
-        # --- Generic / Unknown Files ---
-        else:
-            return "❓"
+        ],
+        "📜",
+    ),
+    # --- Archives / Compressed Files ---
+    **dict.fromkeys(["zip", "rar", "7z", "tar", "gz", "bz2", "xz", "iso"], "📦"),
+    # --- Images ---
+    **dict.fromkeys(
+        ["jpg", "jpeg", "png", "gif", "svg", "ico", "bmp", "webp", "tiff"], "🖼️"
+    ),
+    # --- Media Files ---
+    **dict.fromkeys(["mp4", "avi", "mov", "wmv", "flv", "mkv"], "🎬"),
+    **dict.fromkeys(["mp3", "wav", "flac", "ogg", "aac", "m4a"], "🎵"),
+    # --- Office / Data Files ---
+    **dict.fromkeys(["xls", "xlsx", "csv", "ods"], "📈"),
+    **dict.fromkeys(["ppt", "pptx", "odp"], "🖥️"),
+    **dict.fromkeys(["db", "sqlite", "mdb", "accdb"], "🗃️"),
+    # --- Executables / System Files ---
+    **dict.fromkeys(["exe", "dll", "msi", "app", "apk", "dmg"], "⚙️"),
+    # --- Font Files ---
+    **dict.fromkeys(["ttf", "otf", "woff", "woff2"], "🅰️"),
+}
+
+
+@lru_cache(maxsize=512)
+def get_file_icon(type_: str, extension: str):
+    if type_ == "dir":
+        return "📁"  # Folder
+    if not extension or not extension.strip():
+        return "❓"
+    # --- Generic / Unknown Files fall back to a question mark ---
+    return FILE_ICONS.get(extension.replace(".", "").lower(), "❓")
+
+
+# Sort keys for server-side ordering of directory listings, keyed by table column name
+LIST_SORT_KEYS = {
+    "name": lambda p: p.name.lower(),
+    "type": lambda p: p.type,
+    "extension": lambda p: (p.extension or "").lower(),
+    # Directories first, then by size
+    "size": lambda p: (p.type != FileType.DIR, p.size),
+    "created_at": lambda p: p.created_at or 0,
+    "updated_at": lambda p: p.custom_updated_at or 0,
+}
+
+# Sort keys that need only an entry's (name, is_dir), so a page can be picked before
+# any metadata is read; they order entries the same way as LIST_SORT_KEYS
+ENTRY_TYPE_SORT_KEYS = {
+    "name": lambda e: e[0].lower(),
+    "type": lambda e: FileType.DIR if e[1] else FileType.FILE,
+    "extension": lambda e: "" if e[1] else Path(e[0]).suffix.lower(),
+}
 
 
 class AsyncStreamWriter:
@@ -164,6 +161,12 @@ class StorageManager:
         self._backends: Dict[str, StorageBackend] = {}
         # Name of the currently active storage backend
         self._current_backend_name: Optional[str] = None
+        # Short-lived cache of directory listings, either full metadata or just
+        # (name, is_dir) pairs:
+        # (normalized path, types only) -> (timestamp, directory version, entries)
+        self._list_cache: Dict[tuple[str, bool], tuple[float, Optional[int], list]] = {}
+        # Bumped on every invalidation so listings started earlier are not cached
+        self._list_cache_generation = 0
         # Register the local storage backend by default
         self.register_backend(LocalStorage.name, LocalStorage())
 
@@ -200,6 +203,7 @@ class StorageManager:
         """
         if name in self._backends:
             self._current_backend_name = name
+            self.invalidate_list_cache()
             logger.debug(
                 _("Current storage backend has been switched to '{name}'.").format(
                     name=name
@@ -227,6 +231,53 @@ class StorageManager:
             )
         return self._backends[self._current_backend_name]
 
+    # Directory listing cache
+
+    @staticmethod
+    def _list_cache_key(remote_path: str, types_only: bool) -> tuple[str, bool]:
+        return os.path.normpath(str(remote_path) or "."), types_only
+
+    def _get_cached_listing(
+        self, remote_path: str, version: Optional[int], types_only: bool = False
+    ) -> Optional[list]:
+        cached = self._list_cache.get(self._list_cache_key(remote_path, types_only))
+        if cached is None:
+            return None
+        cached_at, cached_version, entries = cached
+        if cached_version != version:
+            return None
+        if time.monotonic() - cached_at > settings.LIST_FILES_CACHE_TTL:
+            return None
+        return entries
+
+    def _set_cached_listing(
+        self,
+        remote_path: str,
+        version: Optional[int],
+        entries: list,
+        generation: int,
+        types_only: bool = False,
+    ):
+        if generation != self._list_cache_generation:
+            # A mutation ran while the listing was read, so it may already be stale
+            return
+        key = self._list_cache_key(remote_path, types_only)
+        self._list_cache.pop(key, None)
+        if len(self._list_cache) >= settings.LIST_FILES_CACHE_MAXSIZE:
+            # Evict the oldest entry (dicts preserve insertion order)
+            self._list_cache.pop(next(iter(self._list_cache)))
+        self._list_cache[key] = (time.monotonic(), version, entries)
+
+    def invalidate_list_cache(self):
+        """
+        Drop all cached directory listings.
+
+        Called after every mutation, since a change can also affect the child counts
+        reported in ancestor listings.
+        """
+        self._list_cache_generation += 1
+        self._list_cache.clear()
+
     # Proxy methods
 
     def exists(self, remote_path: str) -> bool:
@@ -244,7 +295,11 @@ class StorageManager:
     ) -> bool:
         """Upload a file using a streaming approach."""
         backend = self._get_current_backend()
-        await backend.upload_file(file_object, remote_path)
+        try:
+            await backend.upload_file(file_object, remote_path)
+        finally:
+            # Even a failed write may have partly applied; don't serve stale listings
+            self.invalidate_list_cache()
         return True
 
     def download_file(self, remote_path: str):
@@ -299,36 +354,121 @@ class StorageManager:
     def delete_file(self, remote_path: str) -> bool:
         """Delete a remote file."""
         backend = self._get_current_backend()
-        backend.delete_file(remote_path)
+        try:
+            backend.delete_file(remote_path)
+        finally:
+            self.invalidate_list_cache()
         return True
 
     def list_files(self, remote_path: str) -> list[FileMetadata | DirMetadata]:
         """List metadata of files and directories under the given remote path."""
         backend = self._get_current_backend()
-        return backend.list_files(remote_path)
+        # Out-of-band changes to the directory show up as a new version
+        version = backend.get_directory_version(remote_path)
+        entries = self._get_cached_listing(remote_path, version)
+        if entries is None:
+            generation = self._list_cache_generation
+            entries = backend.list_files(remote_path)
+            self._set_cached_listing(remote_path, version, entries, generation)
+        return entries
+
+    async def list_files_async(
+        self, remote_path: str
+    ) -> list[FileMetadata | DirMetadata]:
+        """List directory contents in a worker thread to keep the event loop responsive."""
+        backend = self._get_current_backend()
+        version = backend.get_directory_version(remote_path)
+        entries = self._get_cached_listing(remote_path, version)
+        if entries is None:
+            generation = self._list_cache_generation
+            entries = await asyncio.to_thread(backend.list_files, remote_path)
+            self._set_cached_listing(remote_path, version, entries, generation)
+        return entries
+
+    async def _list_entry_types_async(self, remote_path: str) -> list[tuple[str, bool]]:
+        """List (name, is_dir) pairs in a worker thread, sharing the listing cache."""
+        backend = self._get_current_backend()
+        version = backend.get_directory_version(remote_path)
+        entry_types = self._get_cached_listing(remote_path, version, types_only=True)
+        if entry_types is None:
+            generation = self._list_cache_generation
+            entry_types = await asyncio.to_thread(backend.list_entry_types, remote_path)
+            self._set_cached_listing(
+                remote_path, version, entry_types, generation, types_only=True
+            )
+        return entry_types
+
+    async def list_files_page(
+        self,
+        remote_path: str,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        descending: bool = False,
+    ) -> tuple[list[FileMetadata | DirMetadata], int]:
+        """
+        List one sorted page of entries under the given remote path.
+
+        Returns a tuple of (entries in the requested window, total number of entries).
+        A `limit` of None or 0 returns every entry from `offset` onwards.
+
+        Unless the sort needs sizes or timestamps, only names and types are listed and
+        metadata is read for the entries in the window alone.
+        """
+        end = offset + limit if limit else None
+
+        if sort_by in LIST_SORT_KEYS and sort_by not in ENTRY_TYPE_SORT_KEYS:
+            entries = await self.list_files_async(remote_path)
+            # Sort a copy; the listing may be shared through the cache
+            entries = sorted(entries, key=LIST_SORT_KEYS[sort_by], reverse=descending)
+            return entries[offset:end], len(entries)
+
+        entry_types = await self._list_entry_types_async(remote_path)
+        sort_key = ENTRY_TYPE_SORT_KEYS.get(sort_by)
+        if sort_key:
+            entry_types = sorted(entry_types, key=sort_key, reverse=descending)
+
+        names = [name for name, is_dir in entry_types[offset:end]]
+        backend = self._get_current_backend()
+        entries = await asyncio.to_thread(
+            backend.get_children_metadata, remote_path, names
+        )
+        return entries, len(entry_types)
 
     def create_directory(self, remote_path: str) -> bool:
         """Create a remote directory."""
         backend = self._get_current_backend()
-        backend.create_directory(remote_path)
+        try:
+            backend.create_directory(remote_path)
+        finally:
+            self.invalidate_list_cache()
         return True
 
     def delete_directory(self, remote_path: str) -> bool:
         """Delete a remote directory."""
         backend = self._get_current_backend()
-        backend.delete_directory(remote_path)
+        try:
+            backend.delete_directory(remote_path)
+        finally:
+            self.invalidate_list_cache()
         return True
 
     def move_file(self, src_path: str, dest_path: str) -> bool:
         """Move a file or directory."""
         backend = self._get_current_backend()
-        backend.move_file(src_path, dest_path)
+        try:
+            backend.move_file(src_path, dest_path)
+        finally:
+            self.invalidate_list_cache()
         return True
 
     def copy_file(self, src_path: str, dest_path: str) -> bool:
         """Copy a file."""
         backend = self._get_current_backend()
-        backend.copy_file(src_path, dest_path)
+        try:
+            backend.copy_file(src_path, dest_path)
+        finally:
+            self.invalidate_list_cache()
         return True
 
     def get_file_metadata(self, remote_path: str) -> FileMetadata | DirMetadata:
@@ -340,6 +480,10 @@ class StorageManager:
         backend = self._get_current_backend()
         return await backend.get_directory_size(remote_path)
 
+    def iter_directory_size(self, remote_path: str) -> AsyncIterator[int]:
+        backend = self._get_current_backend()
+        return backend.iter_directory_size(remote_path)
+
     async def search(
         self, query: str, remote_path: str, offset: int, limit: int
     ) -> list[FileMetadata | DirMetadata]:
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import BinaryIO, AsyncIterator
+from pathlib import PurePosixPath
+from typing import BinaryIO, AsyncIterator, Optional
 
 from app.schemas.file_schema import FileMetadata, DirMetadata
 
@@ -102,6 +103,33 @@ class StorageBackend(ABC):
         Returns a list of metadata objects.
         """
 
+    def list_entry_types(self, remote_path: str) -> list[tuple[str, bool]]:
+        """
+        List (name, is_dir) for every entry that list_files would return.
+
+        Backends that can tell names and types apart without fetching full metadata
+        should override this; it lets a listing be sorted by name or type cheaply.
+        """
+        return [
+            (metadata.name, metadata.is_dir) for metadata in self.list_files(remote_path)
+        ]
+
+    def get_children_metadata(
+        self, remote_path: str, names: list[str]
+    ) -> list[FileMetadata | DirMetadata]:
+        """
+        Retrieve metadata for the named entries of a directory, skipping entries
+        that no longer exist.
+        """
+        parent = PurePosixPath(remote_path)
+        metadata_list = []
+        for name in names:
+            try:
+                metadata_list.append(self.get_file_metadata((parent / name).as_posix()))
+            except StorageFileNotFoundError:
+                continue
+        return metadata_list
+
     @abstractmethod
     def create_directory(self, remote_path: str) -> None:
         """
@@ -135,12 +163,26 @@ class StorageBackend(ABC):
         Retrieve metadata (e.g., size, type, modification time) for the item at the given path.
         """
 
+    def get_directory_version(self, remote_path: str) -> Optional[int]:
+        """
+        Return a token that changes whenever entries are added to, removed from or
+        renamed in the directory, or None if the backend cannot tell cheaply.
+        """
+        return None
+
     @abstractmethod
     async def get_directory_size(self, remote_path: str) -> int:
         """
         Calculate and return the total size (in bytes) of all files within a directory recursively.
         """
 
+    @abstractmethod
+    def iter_directory_size(self, remote_path: str) -> AsyncIterator[int]:
+        """
+        Walk a directory recursively, yielding the running total size (in bytes)
+        as it is computed so callers can report progress or cancel early.
+        """
+
     @abstractmethod
     async def search(
         self, query: str, remote_path: str, offset: int, limit: int
@@ -1,6 +1,7 @@
 import asyncio
 import os
 import shutil
+import stat
 from collections import deque
 from pathlib import Path
 from typing import AsyncIterator, NamedTuple, Optional, Iterator
@@ -198,10 +199,9 @@ class LocalStorage(StorageBackend):
                 )
             )
 
-        chunk_size = 8192
         with full_path.open("rb") as src_file:
             while True:
-                chunk = src_file.read(chunk_size)
+                chunk = src_file.read(settings.STREAM_CHUNK_SIZE)
                 if not chunk:
                     break
                 yield chunk
@@ -232,16 +232,19 @@ class LocalStorage(StorageBackend):
                 )
             ) from e
 
+    def _get_listing_path(self, remote_path: str) -> Path:
+        """Return the local directory to list; absolute paths are used as given."""
+        if not remote_path.startswith("/"):
+            return self._get_full_path(remote_path)
+        return Path(remote_path)
+
     def list_files(self, remote_path: str) -> list[FileMetadata | DirMetadata]:
         """
         List all non-hidden files and directories in the specified directory.
 
         Returns metadata for each entry, excluding those starting with a dot.
         """
-        if not remote_path.startswith("/"):
-            full_path = self._get_full_path(remote_path)
-        else:
-            full_path = Path(remote_path)
+        full_path = self._get_listing_path(remote_path)
 
         if not full_path.exists():
             raise StorageFileNotFoundError(
@@ -254,38 +257,71 @@ class LocalStorage(StorageBackend):
 
         metadata_list = []
         try:
-            for entry_path in full_path.iterdir():
-                if entry_path.name.startswith("."):
+            # scandir reuses readdir's file type, avoiding a second stat per entry
+            with os.scandir(full_path) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    metadata_list.append(self._entry_metadata(entry))
+        except PermissionError as e:
+            raise StoragePermissionError(
+                _("Permission denied when reading directory: {path}").format(
+                    path=full_path
+                )
+            ) from e
+        except Exception as e:
+            raise StorageError(
+                _("Failed to read directory: {error}").format(error=str(e))
+            ) from e
+
+        return metadata_list
+
+    def list_entry_types(self, remote_path: str) -> list[tuple[str, bool]]:
+        """
+        List (name, is_dir) for each non-hidden entry in the specified directory.
+
+        The type comes from readdir itself, so no entry is stat'ed.
+        """
+        full_path = self._get_listing_path(remote_path)
+        try:
+            with os.scandir(full_path) as entries:
+                return [
+                    (entry.name, entry.is_dir())
+                    for entry in entries
+                    if not entry.name.startswith(".")
+                ]
+        except FileNotFoundError as e:
+            raise StorageFileNotFoundError(
+                _("Directory not found: {path}").format(path=full_path)
+            ) from e
+        except NotADirectoryError as e:
+            raise StorageNotADirectoryError(
+                _("Path is not a directory: {path}").format(path=full_path)
+            ) from e
+        except PermissionError as e:
+            raise StoragePermissionError(
+                _("Permission denied when reading directory: {path}").format(
+                    path=full_path
+                )
+            ) from e
+
+    def get_children_metadata(
+        self, remote_path: str, names: list[str]
+    ) -> list[FileMetadata | DirMetadata]:
+        """
+        Retrieve metadata for the named entries of a directory.
+
+        Entries are built the same way as in list_files, and ones removed since the
+        directory was listed are skipped.
+        """
+        full_path = self._get_listing_path(remote_path)
+        metadata_list = []
+        try:
+            for name in names:
+                try:
+                    metadata_list.append(self._entry_metadata(full_path / name))
+                except FileNotFoundError:
                     continue
-                entry_remote_path = entry_path.relative_to(self.root_path).as_posix()
-                stat_info = parse_path_stat(entry_path.stat())
-                is_dir = entry_path.is_dir()
-
-                if is_dir:
-                    metadata = DirMetadata(
-                        name=entry_path.name,
-                        path=entry_remote_path,
-                        size=0,
-                        accessed_at=stat_info.accessed_at,
-                        modified_at=stat_info.modified_at,
-                        created_at=stat_info.created_at,
-                        status_changed_at=stat_info.status_changed_at,
-                        custom_updated_at=stat_info.custom_updated_at,
-                        num_children=len(list(entry_path.iterdir())),
-                    )
-                else:
-                    metadata = FileMetadata(
-                        name=entry_path.name,
-                        path=entry_remote_path,
-                        extension=entry_path.suffix or None,
-                        size=stat_info.size,
-                        accessed_at=stat_info.accessed_at,
-                        modified_at=stat_info.modified_at,
-                        created_at=stat_info.created_at,
-                        status_changed_at=stat_info.status_changed_at,
-                        custom_updated_at=stat_info.custom_updated_at,
-                    )
-                metadata_list.append(metadata)
         except PermissionError as e:
             raise StoragePermissionError(
                 _("Permission denied when reading directory: {path}").format(
@@ -299,6 +335,45 @@ class LocalStorage(StorageBackend):
 
         return metadata_list
 
+    def _entry_metadata(
+        self, entry: os.DirEntry | Path, count_children: bool = True
+    ) -> FileMetadata | DirMetadata:
+        """
+        Build metadata for an `os.scandir` entry or a path found under the root.
+
+        Counting a directory's children needs an extra listing, so callers that
+        don't show it can skip it.
+        """
+        entry_path = Path(os.fspath(entry))
+        entry_remote_path = entry_path.relative_to(self.root_path).as_posix()
+        # Take the type from the same stat() so a Path entry costs one syscall
+        path_stat = entry.stat()
+        stat_info = parse_path_stat(path_stat)
+
+        if stat.S_ISDIR(path_stat.st_mode):
+            return DirMetadata(
+                name=entry.name,
+                path=entry_remote_path,
+                size=0,
+                accessed_at=stat_info.accessed_at,
+                modified_at=stat_info.modified_at,
+                created_at=stat_info.created_at,
+                status_changed_at=stat_info.status_changed_at,
+                custom_updated_at=stat_info.custom_updated_at,
+                num_children=len(os.listdir(entry_path)) if count_children else 0,
+            )
+        return FileMetadata(
+            name=entry.name,
+            path=entry_remote_path,
+            extension=entry_path.suffix or None,
+            size=stat_info.size,
+            accessed_at=stat_info.accessed_at,
+            modified_at=stat_info.modified_at,
+            created_at=stat_info.created_at,
+            status_changed_at=stat_info.status_changed_at,
+            custom_updated_at=stat_info.custom_updated_at,
+        )
+
     def create_directory(self, remote_path: str):
         """
         Create a new directory, including any necessary parent directories.
@@ -404,15 +479,17 @@ class LocalStorage(StorageBackend):
         Retrieve detailed metadata for a file or directory at the given path.
         """
         full_path = self._get_full_path(remote_path)
-        if not full_path.exists():
+        # One stat() answers existence, type and timestamps together
+        try:
+            path_stat = full_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
             raise StorageFileNotFoundError(
                 _("File or directory not found: {path}").format(path=full_path)
             )
 
-        stat_info = parse_path_stat(full_path.stat())
-        is_dir = full_path.is_dir()
+        stat_info = parse_path_stat(path_stat)
 
-        if is_dir:
+        if stat.S_ISDIR(path_stat.st_mode):
             return DirMetadata(
                 name=full_path.name,
                 path=remote_path,
@@ -422,7 +499,7 @@ class LocalStorage(StorageBackend):
                 created_at=stat_info.created_at,
                 status_changed_at=stat_info.status_changed_at,
                 custom_updated_at=stat_info.custom_updated_at,
-                num_children=len(list(full_path.iterdir())),
+                num_children=len(os.listdir(full_path)),
             )
         else:
             return FileMetadata(
@@ -437,10 +514,57 @@ class LocalStorage(StorageBackend):
                 custom_updated_at=stat_info.custom_updated_at,
             )
 
-    async def get_directory_size(self, remote_path: str) -> int:
+    def get_directory_version(self, remote_path: str) -> Optional[int]:
         """
-        Asynchronously compute the total size (in bytes) of a directory and its contents.
+        Return the directory's modification time in nanoseconds.
 
+        Creating, deleting or renaming an entry updates it, so a cached listing
+        taken at an older mtime is stale.
+        """
+        try:
+            return self._get_listing_path(remote_path).stat().st_mtime_ns
+        except (OSError, StorageError):
+            return None
+
+    @staticmethod
+    def _scan_directory_size(path: str) -> tuple[int, list[str]]:
+        """
+        Sum the sizes of the files directly inside a directory.
+
+        Returns that total together with the subdirectories still to be walked.
+        Hidden entries and symlinks are skipped; permission errors are ignored.
+        """
+        total_size = 0
+        subdirs = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.name.startswith("."):
+                        continue
+                    try:
+                        # DirEntry caches its type, and its stat result on Windows
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                    except PermissionError:
+                        continue
+                    except OSError as e:
+                        logger.warning(f"Failed to access {entry.path}: {e}")
+        except PermissionError:
+            return 0, []
+        except OSError as e:
+            logger.warning(f"Failed to list directory {path}: {e}")
+            return 0, []
+        return total_size, subdirs
+
+    async def iter_directory_size(self, remote_path: str) -> AsyncIterator[int]:
+        """
+        Walk a directory tree and yield the running total size (in bytes).
+
+        Up to `DIRECTORY_SIZE_WORKERS` directories are scanned concurrently in worker
+        threads, hiding stat() latency, and a running total is yielded after each one
+        so callers can show progress and stop the walk at any point.
         Hidden files and directories are excluded. Permission errors are silently ignored.
         """
         full_path = self._get_full_path(remote_path)
@@ -453,34 +577,40 @@ class LocalStorage(StorageBackend):
                 _("Path is not a directory: {path}").format(path=full_path)
             )
 
-        async def _get_size(path: Path) -> int:
-            total_size = 0
-            try:
-                entries = await asyncio.to_thread(list, path.iterdir())
-            except PermissionError:
-                return 0
-            except Exception as e:
-                logger.warning(f"Failed to list directory {path}: {e}")
-                return 0
+        total_size = 0
+        pending = [str(full_path)]
+        running: set[asyncio.Task] = set()
+        try:
+            while pending or running:
+                while pending and len(running) < settings.DIRECTORY_SIZE_WORKERS:
+                    running.add(
+                        asyncio.create_task(
+                            asyncio.to_thread(self._scan_directory_size, pending.pop())
+                        )
+                    )
+                done, running = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    size, subdirs = task.result()
+                    total_size += size
+                    pending.extend(subdirs)
+                yield total_size
+        finally:
+            # Abandoned walk: drop the scans that have not started yet
+            for task in running:
+                task.cancel()
 
-            for entry in entries:
-                if entry.name.startswith("."):
-                    continue
-                try:
-                    if entry.is_file():
-                        stat_info = await asyncio.to_thread(entry.stat)
-                        total_size += stat_info.st_size
-                    elif entry.is_dir():
-                        size = await _get_size(entry)
-                        total_size += size
-                except PermissionError:
-                    continue
-                except Exception as e:
-                    logger.warning(f"Failed to access {entry}: {e}")
-            return total_size
+    async def get_directory_size(self, remote_path: str) -> int:
+        """
+        Asynchronously compute the total size (in bytes) of a directory and its contents.
 
-        size = await _get_size(full_path)
-        return size
+        Hidden files and directories are excluded. Permission errors are silently ignored.
+        """
+        total_size = 0
+        async for total_size in self.iter_directory_size(remote_path):
+            pass
+        return total_size
 
     @staticmethod
     def _sync_search_iter(
@@ -525,70 +655,6 @@ class LocalStorage(StorageBackend):
             except Exception as e:
                 logger.error(f"Search error in {current_path}: {e}")
 
-    def _get_metadata_for_search(self, path: Path):
-        """Generate metadata for a search result entry."""
-        if not path.is_relative_to(self.root_path):
-            return None
-        try:
-            stat = parse_path_stat(path.stat())
-            remote_path = path.relative_to(self.root_path).as_posix()
-            if path.is_dir():
-                return DirMetadata(
-                    name=path.name,
-                    path=remote_path,
-                    size=0,
-                    accessed_at=stat.accessed_at,
-                    modified_at=stat.modified_at,
-                    created_at=stat.created_at,
-                    status_changed_at=stat.status_changed_at,
-                    custom_updated_at=stat.custom_updated_at,
-                )
-            return FileMetadata(
-                name=path.name,
-                path=remote_path,
-                extension=path.suffix or None,
-                size=stat.size,
-                accessed_at=stat.accessed_at,
-                modified_at=stat.modified_at,
-                created_at=stat.created_at,
-                status_changed_at=stat.status_changed_at,
-                custom_updated_at=stat.custom_updated_at,
-            )
-        except Exception as e:
-            logger.warning(f"Metadata failed for {path}: {e}")
-            return None
-
-    async def search_iter(
-        self,
-        query: str,
-        remote_path: str = "/",
-        match_case: bool = False,
-        file_only: bool = False,
-    ):
-        """
-        Asynchronously iterate over search results matching the query.
-
-        Uses a thread to avoid blocking the event loop during I/O-heavy operations.
-        """
-        start_path = self._get_full_path(remote_path)
-        if not start_path.exists():
-            raise StorageFileNotFoundError(remote_path)
-
-        iterator = await asyncio.to_thread(
-            self._sync_search_iter,
-            start_path,
-            query,
-            match_case,
-            file_only,
-            self.MAX_SEARCH_DEPTH,
-            self.MAX_SEARCH_RESULTS,
-        )
-
-        for path in iterator:
-            metadata = await asyncio.to_thread(self._get_metadata_for_search, path)
-            if metadata:
-                yield metadata
-
     async def search(
         self,
         query: str,
@@ -603,12 +669,36 @@ class LocalStorage(StorageBackend):
 
         Returns up to `limit` results starting from the given `offset`.
         """
-        results = []
-        index = 0
-        async for item in self.search_iter(query, remote_path, match_case, file_only):
-            if index >= offset:
-                results.append(item)
-                if len(results) >= limit:
-                    break
-            index += 1
-        return results
+        start_path = self._get_full_path(remote_path)
+        if not start_path.exists():
+            raise StorageFileNotFoundError(remote_path)
+
+        def _collect_page() -> list[FileMetadata | DirMetadata]:
+            results = []
+            index = 0
+            matches = self._sync_search_iter(
+                start_path,
+                query,
+                match_case,
+                file_only,
+                self.MAX_SEARCH_DEPTH,
+                self.MAX_SEARCH_RESULTS,
+            )
+            for path in matches:
+                if not path.is_relative_to(self.root_path):
+                    continue
+                try:
+                    metadata = self._entry_metadata(path, count_children=False)
+                except Exception as e:
+                    logger.warning(f"Metadata failed for {path}: {e}")
+                    continue
+                # Only entries that produced metadata count towards offset and limit
+                if index >= offset:
+                    results.append(metadata)
+                    if len(results) >= limit:
+                        break
+                index += 1
+            return results
+
+        # Walk and stat in a worker thread to keep the event loop responsive
+        return await asyncio.to_thread(_collect_page)
@@ -1,6 +1,6 @@
 from contextlib import asynccontextmanager
 
-from nicegui import ui
+from nicegui import app, ui
 
 from app.config import settings
 from app.core.i18n import _
@@ -110,6 +110,11 @@ kbd {{
             self.footer_component.render(**args)
             footer_el = self.footer_component
 
+        # One-shot success message left by the previous page before navigating here
+        flash = app.storage.user.pop("flash", None)
+        if flash:
+            notify.success(flash)
+
         try:
             with ui.element().classes("w-full" + max_w):
                 yield header_el, footer_el
@@ -727,6 +727,7 @@ class MetadataDialog(Dialog):
         metadata: FileMetadata | DirMetadata,
         current_path: Path,
         refresh_browser_func: Callable,
+        update_browser_row_func: Optional[Callable] = None,
     ):
         super().__init__()
         self.current_path = current_path
@@ -735,6 +736,7 @@ class MetadataDialog(Dialog):
         self.file_manager = file_manager
         self.current_user = current_user
         self.refresh_browser = refresh_browser_func
+        self.update_browser_row = update_browser_row_func
         self.size_label: ui.label | None = None
         self.calc_btn: ui.button | None = None
         self.user_timezone = get_user_timezone()
@@ -841,6 +843,15 @@ class MetadataDialog(Dialog):
         dir_size = await self.file_manager.get_directory_size(self.metadata.path)
         self.size_label.text = bytes_to_human_readable(dir_size)
 
+    async def _update_browser(
+        self, metadata: Optional[FileMetadata | DirMetadata] = None
+    ):
+        """Patch the browser row for this item, or fall back to a full refresh."""
+        if self.update_browser_row:
+            await self.update_browser_row(self.metadata.path, metadata)
+        else:
+            await self.refresh_browser()
+
     async def on_delete_button_click(self):
         confirm = await ConfirmDialog(
             _("Confirm Delete"),
@@ -855,7 +866,9 @@ class MetadataDialog(Dialog):
                 notify.success(_("Deleted successfully"))
             except Exception as e:
                 notify.error(str(e))
-            await self.refresh_browser()
+                await self.refresh_browser()
+                return
+            await self._update_browser()
 
     async def on_rename_button_click(self):
         new_name = await RenameDialog(
@@ -871,7 +884,11 @@ class MetadataDialog(Dialog):
                 notify.success(_("Renamed successfully"))
             except Exception as e:
                 notify.error(str(e))
-            await self.refresh_browser()
+                await self.refresh_browser()
+                return
+            await self._update_browser(
+                self.file_manager.get_file_metadata(new_path.as_posix())
+            )
 
     async def on_move_button_click(self):
         target_path = await MoveDialog(
@@ -892,7 +909,9 @@ class MetadataDialog(Dialog):
                 )
             except Exception as e:
                 notify.error(str(e))
-            await self.refresh_browser()
+                await self.refresh_browser()
+                return
+            await self._update_browser()
 
     async def on_share_button_click(self):
         expire_define = await ShareDialog(
@@ -1,5 +1,9 @@
+import asyncio
+import errno
+import json
+import os
 import time
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import Optional, Literal
 
@@ -8,7 +12,7 @@ from nicegui.events import GenericEventArguments
 from starlette.formparsers import MultiPartParser
 
 from app.config import settings
-from app.core.i18n import _
+from app.core.i18n import _, get_current_language
 from app.models.user_model import User
 from app.schemas.file_schema import DirMetadata, FileMetadata, FileType, FileSource
 from app.security.guards import require_user
@@ -21,6 +25,7 @@ from app.services.file_service import (
     get_user_last_path,
 )
 from app.services.user_service import get_user_timezone
+from app.storage.base import StoragePermissionError
 from app.ui.components.button import custom_button
 from app.ui.components.clipboard import copy_to_clipboard
 from app.ui.components.dialog import (
@@ -35,24 +40,148 @@ from app.ui.components.notify import notify
 from app.ui.components.separator import breadcrumb_separator
 from app.ui.theme import theme
 from app.utils.platform import normalize_key
-from app.utils.size import bytes_to_human_readable
-from app.utils.time import timestamp_to_human_readable
 
-size_sort_js = """(a, b, rowA, rowB) => {
-    const isDirA = rowA.type === 'dir';
-    const isDirB = rowB.type === 'dir';
+# Directories with at least this many entries are paginated server-side
+LARGE_DIRECTORY_THRESHOLD = 50
+PAGE_SIZE = 15
+
+CONFIRM_PREVIEW_LIMIT = 20
+
+# Minimum seconds between two handled row double-clicks
+DOUBLE_CLICK_INTERVAL = 0.15
+
+# Client-side formatters for raw size/timestamp cells, mirroring
+# bytes_to_human_readable and timestamp_to_human_readable
+FORMATTERS_SCRIPT = """
+<script>
+window.starDrive = window.starDrive || {};
+(() => {
+    const units = ["Bytes", "KB", "MB", "GB", "TB", "PB", "EB", "ZB"];
+    let timeFormat = null;
+
+    starDrive.setTimeZone = (timeZone) => {
+        timeFormat = new Intl.DateTimeFormat("en-US", {
+            timeZone,
+            year: "numeric", month: "2-digit", day: "2-digit",
+            hour: "2-digit", minute: "2-digit", second: "2-digit",
+            hourCycle: "h23",
+        });
+    };
+
+    starDrive.humanBytes = (value) => {
+        if (!value) return "-";
+        for (const unit of units) {
+            if (value < 1024) return `${value.toFixed(2)} ${unit}`;
+            value /= 1024;
+        }
+        return `${value.toFixed(2)} YB`;
+    };
+
+    starDrive.humanTime = (timestamp) => {
+        if (!timestamp) return "None";
+        if (!timeFormat) starDrive.setTimeZone(undefined);
+        const p = Object.fromEntries(
+            timeFormat.formatToParts(new Date(timestamp * 1000)).map((part) => [part.type, part.value])
+        );
+        return `${p.year}-${p.month}-${p.day} ${p.hour}:${p.minute}:${p.second}`;
+    };
+})();
+</script>
+"""
+
+# Plain text interpolation; the <b> wrapper is what keyboard navigation reads names from
+NAME_SLOT_HTML = (
+    '<q-td :props="props">{{ props.row.icon }} <b>{{ props.row.raw_name }}</b></q-td>'
+)
 
-    // Directories first
-    if (isDirA && !isDirB) return -1;
-    if (!isDirA && isDirB) return 1;
 
-    // Sort by raw_size
-    return rowA.raw_size - rowB.raw_size;
-}"""
+@lru_cache(maxsize=8)
+def file_table_columns(lang_code: str) -> tuple[dict, ...]:
+    """Build the static file table column definitions for the given language."""
+    return (
+        {
+            "name": "name",
+            "label": _("Name", lang_code),
+            "field": "raw_name",
+            "align": "left",
+            "required": True,
+        },
+        {
+            "name": "type",
+            "label": _("Type", lang_code),
+            "field": "type",
+            "classes": "hidden",
+            "headerClasses": "hidden",
+        },
+        {
+            "name": "extension",
+            "label": _("Extension", lang_code),
+            "field": "extension",
+            # "classes": "hidden",
+            # "headerClasses": "hidden",
+            "align": "left",
+            "style": "width: 0px",
+        },
+        {
+            "name": "size",
+            "label": _("Size", lang_code),
+            "field": "size",
+            ":format": "value => starDrive.humanBytes(value)",
+            "required": True,
+            "align": "right",
+            "style": "width: 0px",
+        },
+        {
+            "name": "created_at",
+            "label": _("Created At", lang_code),
+            "classes": "hidden",
+            "headerClasses": "hidden",
+            "field": "created_at",
+            ":format": "value => starDrive.humanTime(value)",
+            "style": "width: 0px",
+        },
+        {
+            "name": "updated_at",
+            "label": _("Updated At", lang_code),
+            "field": "updated_at",
+            ":format": "value => starDrive.humanTime(value)",
+            "style": "width: 0px",
+        },
+    )
+
+
+@lru_cache(maxsize=8)
+def action_slot_html(lang_code: str) -> str:
+    """Build the action column slot template for the given language."""
+    return f"""
+                <q-td :props="props">
+                    <q-btn icon="info" @click.stop="$parent.$emit('info', props.row)" class="text-primary" flat dense><q-tooltip>{_("Show file information", lang_code)}</q-tooltip></q-btn>
+                </q-td>
+            """
+
 
 MultiPartParser.spool_max_size = settings.MULTIPARTPARSER_SPOOL_MAX_SIZE
 
 
+# OS errors worth retrying; anything else (permissions, disk full, bad path) is final
+TRANSIENT_UPLOAD_ERRNOS = frozenset(
+    {errno.EAGAIN, errno.EBUSY, errno.EINTR, errno.ETIMEDOUT}
+)
+
+
+def is_transient_upload_error(exc: BaseException) -> bool:
+    """Return whether an upload failure may succeed if the upload is retried."""
+    if isinstance(exc, StoragePermissionError):
+        return False
+    while exc is not None:
+        if isinstance(exc, (TimeoutError, ConnectionError)):
+            return True
+        if isinstance(exc, OSError) and exc.errno in TRANSIENT_UPLOAD_ERRNOS:
+            return True
+        exc = exc.__cause__
+    return False
+
+
 def key_event_debounce(wait_time: float):
     def decorator(func):
         last_called = 0
@@ -88,6 +217,11 @@ class FileBrowserTable:
         self.current_user = current_user
         self.user_timezone = get_user_timezone()
 
+        ui.add_head_html(FORMATTERS_SCRIPT)
+        ui.add_head_html(
+            f"<script>starDrive.setTimeZone({json.dumps(self.user_timezone.key)})</script>"
+        )
+
         self.browser_table: Optional[ui.table] = None
         self.action_column = {
             "sortable": False,
@@ -118,6 +252,7 @@ class FileBrowserTable:
 
         self.has_dialog_open = False
         self.keyboard_event_registered = False
+        self.last_double_click_at = 0.0
 
         self.footer_container = footer_container
 
@@ -134,55 +269,18 @@ class FileBrowserTable:
         @ui.refreshable
         @require_user
         async def browser_content():
-            self.file_list = self.file_manager.list_files(str(self.current_path))
+            # Fetch enough entries to decide whether the directory needs paging
+            self.file_list, total = await self.file_manager.list_files_page(
+                str(self.current_path),
+                limit=LARGE_DIRECTORY_THRESHOLD,
+                sort_by="type",
+            )
+            rows_per_page = 0 if total < LARGE_DIRECTORY_THRESHOLD else PAGE_SIZE
+            if rows_per_page:
+                self.file_list = self.file_list[:rows_per_page]
 
             columns = [
-                {
-                    "name": "name",
-                    "label": _("Name"),
-                    "field": "name",
-                    "align": "left",
-                    "required": True,
-                },
-                {
-                    "name": "type",
-                    "label": _("Type"),
-                    "field": "type",
-                    "classes": "hidden",
-                    "headerClasses": "hidden",
-                },
-                {
-                    "name": "extension",
-                    "label": _("Extension"),
-                    "field": "extension",
-                    # "classes": "hidden",
-                    # "headerClasses": "hidden",
-                    "align": "left",
-                    "style": "width: 0px",
-                },
-                {
-                    "name": "size",
-                    "label": _("Size"),
-                    "field": "size",
-                    "required": True,
-                    ":sort": size_sort_js,
-                    "align": "right",
-                    "style": "width: 0px",
-                },
-                {
-                    "name": "created_at",
-                    "label": _("Created At"),
-                    "classes": "hidden",
-                    "headerClasses": "hidden",
-                    "field": "created_at",
-                    "style": "width: 0px",
-                },
-                {
-                    "name": "updated_at",
-                    "label": _("Updated At"),
-                    "field": "updated_at",
-                    "style": "width: 0px",
-                },
+                *file_table_columns(get_current_language()),
                 self.action_column,
             ]
 
@@ -201,11 +299,13 @@ class FileBrowserTable:
                 },
             ).classes("w-full h-full")
 
+            # Setting rowsNumber switches q-table to server-side pagination and sorting
             self.browser_table.pagination = {
                 "sortBy": "type",
                 "descending": False,
                 "page": 1,
-                "rowsPerPage": 0 if len(self.file_list) < 50 else 15,
+                "rowsPerPage": rows_per_page,
+                "rowsNumber": total,
             }
 
             with self.browser_table.add_slot("no-data"):
@@ -355,51 +455,20 @@ class FileBrowserTable:
                     )
 
             self.browser_table.add_slot(
-                "body-cell-action",
-                f"""
-                <q-td :props="props">
-                    <q-btn icon="info" @click.stop="$parent.$emit('info', props.row)" class="text-primary" flat dense><q-tooltip>{_("Show file information")}</q-tooltip></q-btn>
-                </q-td>
-            """,
+                "body-cell-action", action_slot_html(get_current_language())
             )
 
-            self.browser_table.add_slot(
-                "body-cell-name", '<q-td v-html="props.row.name"></q-td>'
-            )
+            self.browser_table.add_slot("body-cell-name", NAME_SLOT_HTML)
 
-            self.browser_table.rows = [
-                {
-                    "name": f"{get_file_icon(p.type, p.extension)} <b>{p.name}</b>",
-                    "raw_name": p.name,
-                    "type": p.type,
-                    "extension": p.extension if p.extension else "-",
-                    "path": p.path,
-                    "size": bytes_to_human_readable(p.size) if p.size else "-",
-                    "raw_size": p.size if p.size else -1,
-                    "created_at": (
-                        timestamp_to_human_readable(p.created_at, self.user_timezone)
-                    ),
-                    "updated_at": (
-                        timestamp_to_human_readable(
-                            p.custom_updated_at, self.user_timezone
-                        )
-                    ),
-                }
-                for p in self.file_list
-            ]
+            self.browser_table.rows = self._build_rows(self.file_list)
 
-            if self.browser_table.rows:
-                click_event = GenericEventArguments(
-                    sender=self.browser_table,
-                    args=[None, self.browser_table.rows[0], 0],
-                    client=app.storage.client,
-                )
-                await self.handle_row_click(click_event)
+            await self.select_first_row()
 
             self.browser_table.on("row-click", self.handle_row_click)
             self.browser_table.on("row-dblclick", self.handle_row_double_click)
 
             self.browser_table.on("info", self.handle_info_button_click)
+            self.browser_table.on("request", self.handle_table_request)
 
             if not self.keyboard_event_registered:
                 ui.on("keydown.prevent", self.handle_keyboard_event)
@@ -417,6 +486,93 @@ class FileBrowserTable:
 
         ui.timer(0.1, self.refresh_func, once=True)
 
+    def _build_rows(self, file_list: list[FileMetadata | DirMetadata]) -> list[dict]:
+        """
+        Convert metadata entries into table rows in a single pass.
+
+        Sizes and timestamps are sent raw and formatted by the table on the client.
+        """
+        rows = []
+        append = rows.append
+        for p in file_list:
+            extension = p.extension
+            append(
+                {
+                    "icon": get_file_icon(p.type, extension),
+                    "raw_name": p.name,
+                    "type": p.type,
+                    "extension": extension or "-",
+                    "path": p.path,
+                    "size": p.size,
+                    "created_at": p.created_at,
+                    "updated_at": p.custom_updated_at,
+                }
+            )
+        return rows
+
+    async def remove_rows(self, paths: set[str]):
+        """Drop the rows for the given paths without re-listing the whole directory."""
+        rows = [row for row in self.browser_table.rows if row["path"] not in paths]
+        removed = len(self.browser_table.rows) - len(rows)
+        self.browser_table.selected = [
+            row for row in self.browser_table.selected if row["path"] not in paths
+        ]
+
+        pagination = self.browser_table.pagination
+        if not removed or "rowsNumber" not in pagination:
+            self.browser_table.rows = rows
+            return
+
+        total = max(pagination["rowsNumber"] - removed, 0)
+        rows_per_page = pagination.get("rowsPerPage", 0)
+        if not rows_per_page:
+            self.browser_table.rows = rows
+            self.browser_table.pagination = {**pagination, "rowsNumber": total}
+            return
+
+        # Pull the following entries up into the page, stepping back if it is now empty
+        last_page = max(1, (total + rows_per_page - 1) // rows_per_page)
+        await self.load_page(
+            {**pagination, "page": min(pagination.get("page", 1), last_page)}
+        )
+
+    async def update_row(
+        self, path: str, metadata: Optional[FileMetadata | DirMetadata] = None
+    ):
+        """
+        Replace the row at `path` with one built from `metadata`.
+
+        The row is removed when `metadata` is None (e.g. after a delete or move).
+        """
+        if metadata is None:
+            await self.remove_rows({path})
+        else:
+            (new_row,) = self._build_rows([metadata])
+            self.browser_table.rows = [
+                new_row if row["path"] == path else row
+                for row in self.browser_table.rows
+            ]
+            # Keyboard actions read the selection, so it must hold the new row too
+            self.browser_table.selected = [
+                new_row if row["path"] == path else row
+                for row in self.browser_table.selected
+            ]
+
+        # A full refresh would have re-selected a row; keep that behaviour
+        if not self.is_select_mode and not self.browser_table.selected:
+            await self.select_first_row()
+
+    async def select_first_row(self):
+        """Select the first row, as a click would, if the table has any rows."""
+        if not self.browser_table.rows:
+            return
+        click_event = GenericEventArguments(
+            sender=self.browser_table,
+            args=[None, self.browser_table.rows[0], 0],
+            client=app.storage.client,
+        )
+        await self.handle_row_click(click_event)
+
     @property
     def current_path(self) -> Path:
         return self._current_path
@@ -439,13 +595,14 @@ class FileBrowserTable:
 
         await self.goto_func(self.current_path.parent)
 
-    async def goto_func(self, path: Path):
+    async def goto_func(self, path: Path | str):
+        # Lexical normalisation only: resolve() would stat every component
+        path = Path(os.path.normpath(path))
+        # Already there: nothing to re-list
+        if path == self.current_path:
+            return
+
         self.current_path = path
-        self.current_path = (
-            self.current_path.resolve()
-            if self.current_path.is_absolute()
-            else self.current_path.resolve().relative_to(Path.cwd())
-        )
         await self.refresh()
         return
 
@@ -455,6 +612,32 @@ class FileBrowserTable:
             str(self.current_path), message=_("Path copied to clipboard.")
         )
 
+    async def load_page(self, pagination: dict):
+        """Fetch and show the page of rows described by `pagination`."""
+        rows_per_page = pagination.get("rowsPerPage", 0)
+        page = pagination.get("page", 1)
+
+        self.file_list, total = await self.file_manager.list_files_page(
+            str(self.current_path),
+            offset=(page - 1) * rows_per_page,
+            limit=rows_per_page,
+            sort_by=pagination.get("sortBy"),
+            descending=pagination.get("descending", False),
+        )
+
+        self.browser_table.pagination = {**pagination, "rowsNumber": total}
+        self.browser_table.rows = self._build_rows(self.file_list)
+        self.browser_table.update()
+
+    @require_user
+    async def handle_table_request(self, e: events.GenericEventArguments):
+        """Serve a page/sort request from the table with only the visible window."""
+        await self.load_page(e.args["pagination"])
+
+        # The old selection is on another page now; select as a fresh listing would
+        if not self.is_select_mode:
+            await self.select_first_row()
+
     async def handle_row_click(self, e: events.GenericEventArguments):
         click_event_params, click_row, click_index = e.args
 
@@ -520,7 +703,15 @@ class FileBrowserTable:
         if self.is_select_mode:
             return
 
+        # Ignore duplicate double-click events fired in quick succession
+        now = time.monotonic()
+        if now - self.last_double_click_at < DOUBLE_CLICK_INTERVAL:
+            return
+        self.last_double_click_at = now
+
         if from_keyboard:
+            if not self.browser_table.selected:
+                return
             click_row = self.browser_table.selected[0]
         else:
             click_event_params, click_row, click_index = e.args
@@ -528,7 +719,7 @@ class FileBrowserTable:
         file_name = click_row["raw_name"]
 
         if click_row["type"] == "dir":
-            await self.goto_func(Path(target_path))
+            await self.goto_func(target_path)
             return
         else:
             confirm = await ConfirmDialog(
@@ -633,12 +824,19 @@ class FileBrowserTable:
                     )
                     continue
 
-            try:
-                await self.file_manager.upload_file(
-                    f.iterate(), str(self.current_path / f.name)
-                )
-            except Exception as up_e:
-                notify.error(str(up_e))
+            # Retry transient failures with exponential backoff (1s, 2s, ...)
+            for attempt in range(settings.UPLOAD_RETRY_ATTEMPTS):
+                try:
+                    await self.file_manager.upload_file(
+                        f.iterate(), str(self.current_path / f.name)
+                    )
+                    break
+                except Exception as up_e:
+                    last_attempt = attempt == settings.UPLOAD_RETRY_ATTEMPTS - 1
+                    if last_attempt or not is_transient_upload_error(up_e):
+                        notify.error(str(up_e))
+                        break
+                    await asyncio.sleep(2**attempt)
 
         self.upload_component.clear()
 
@@ -717,20 +915,24 @@ class FileBrowserTable:
                 )
                 return
 
-            result = []
+            moved_paths = set()
             for item in self.browser_table.selected:
                 try:
                     self.file_manager.move_file(
                         item["path"], confirm / item["raw_name"]
                     )
-                    result.append({"action": "delete", "raw": item, "result": True})
+                    moved_paths.add(item["path"])
                 except Exception as e:
                     notify.error(str(e))
-            notify.success(_("Moved {count} items").format(count=len(result)))
+            notify.success(_("Moved {count} items").format(count=len(moved_paths)))
         else:
             return
 
-        await self.refresh()
+        # Only re-list the directory if something went wrong
+        if len(moved_paths) == len(self.browser_table.selected):
+            await self.remove_rows(moved_paths)
+        else:
+            await self.refresh()
 
     @require_user
     async def handle_delete_button_click(self):
@@ -738,33 +940,45 @@ class FileBrowserTable:
             notify.warning(_("Please select at least one file"))
             return
 
+        selected_count = len(self.browser_table.selected)
+        # Only preview the first few items so large selections stay cheap to render
+        message = [
+            f"{get_file_icon(item["type"], item["extension"])} {item["raw_name"]}"
+            for item in self.browser_table.selected[:CONFIRM_PREVIEW_LIMIT]
+        ]
+        if selected_count > CONFIRM_PREVIEW_LIMIT:
+            message.append(
+                _("... and {count} more").format(
+                    count=selected_count - CONFIRM_PREVIEW_LIMIT
+                )
+            )
+
         confirm = await ConfirmDialog(
-            title=_("Delete {count} items").format(
-                count=len(self.browser_table.selected)
-            ),
-            message=[
-                f"{get_file_icon(item["type"], item["extension"])} {item["raw_name"]}"
-                for item in self.browser_table.selected
-            ],
+            title=_("Delete {count} items").format(count=selected_count),
+            message=message,
             warning=True,
         ).open()
 
         if confirm:
-            result = []
+            deleted_paths = set()
             try:
                 for item in self.browser_table.selected:
                     if item["type"] == "dir":
                         self.file_manager.delete_directory(item["path"])
                     else:
                         self.file_manager.delete_file(item["path"])
-                    result.append({"action": "delete", "raw": item, "result": True})
-                notify.success(_("Deleted {count} items").format(count=len(result)))
+                    deleted_paths.add(item["path"])
+                notify.success(
+                    _("Deleted {count} items").format(count=len(deleted_paths))
+                )
             except Exception as e:
                 notify.error(str(e))
+                await self.refresh()
+                return
         else:
             return
 
-        await self.refresh()
+        await self.remove_rows(deleted_paths)
 
     @require_user
     async def handle_search_button_click(self):
@@ -805,6 +1019,7 @@ class FileBrowserTable:
                 item_metadata,
                 self.current_path,
                 self.refresh,
+                self.update_row,
             ).open()
             return
         else:
@@ -1,5 +1,4 @@
-from fastapi.responses import RedirectResponse
-from nicegui import APIRouter, app, ui
+from nicegui import APIRouter, ui
 
 from app import globals
 from app.core.i18n import _
@@ -11,18 +10,6 @@ from app.ui.components.table import FileBrowserTable
 this_page_routes = "/home"
 
 
-@app.get("/")
-def index():
-    """Redirect root path to the home page."""
-    return RedirectResponse(f"{this_page_routes}/")
-
-
-@app.get(this_page_routes)
-def browser_index():
-    """Redirect base home route to its index page."""
-    return RedirectResponse(f"{this_page_routes}/")
-
-
 router = APIRouter(prefix=this_page_routes)
 
 
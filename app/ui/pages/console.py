@@ -1,10 +1,11 @@
 import gc
 import os
+import sys
+import time
 
 import psutil
 from fastapi.requests import Request
 from nicegui import Client, ui, app, APIRouter
-from starlette.responses import RedirectResponse
 
 from app.config import settings
 from app.core.i18n import _
@@ -18,24 +19,53 @@ from app.ui.theme import theme
 this_page_routes = "/console"
 
 
-@app.get(this_page_routes)
-def browser_index():
-    """Redirect the console base route to its index page."""
-    return RedirectResponse(f"{this_page_routes}/")
+router = APIRouter(prefix=this_page_routes)
 
+# Metrics refresh interval (seconds); backs off while the host is idle
+METRICS_INTERVAL = 5.0
+METRICS_MAX_INTERVAL = 30.0
+# Number of consecutive quiet ticks before the interval is doubled
+METRICS_IDLE_TICKS = 3
+# Changes up to this (as a fraction) count as quiet
+METRICS_CHANGE_THRESHOLD = 0.01
+# Disk usage changes slowly, so it is only re-probed after this many seconds
+DISK_USAGE_TTL = 30.0
 
-router = APIRouter(prefix=this_page_routes)
+# Total memory is constant for the process lifetime
+MEMORY_TOTAL_GB = round(psutil.virtual_memory().total / (1024**3), 2)
+
+# Reused across ticks instead of re-opening /proc/<pid> on every call
+CURRENT_PROCESS = psutil.Process(os.getpid())
+
+# The first cpu_percent(interval=None) call always returns 0.0, so prime it once
+psutil.cpu_percent(interval=None)
+
+_disk_usage_cache = {"ts": 0.0, "value": None}
+_metrics_cache = {"value": None}
+# IDs of connected console clients reading the shared metrics snapshot
+_metrics_subscribers: set[str] = set()
 
 
 def get_process_memory() -> int:
     """Return the current memory usage (in bytes) of the application process."""
-    process = psutil.Process(os.getpid())
-    return process.memory_info().rss
+    return CURRENT_PROCESS.memory_info().rss
+
+
+def get_disk_usage():
+    """Return root disk usage, re-probing at most once every DISK_USAGE_TTL seconds."""
+    now = time.monotonic()
+    if (
+        _disk_usage_cache["value"] is None
+        or now - _disk_usage_cache["ts"] > DISK_USAGE_TTL
+    ):
+        _disk_usage_cache["value"] = psutil.disk_usage("/")
+        _disk_usage_cache["ts"] = now
+    return _disk_usage_cache["value"]
 
 
-def get_system_metrics():
+def collect_system_metrics() -> dict:
     """
-    Collect key system and application performance metrics.
+    Probe key system and application performance metrics.
 
     Returns:
         dict: A dictionary containing CPU, memory, disk, and load average statistics.
@@ -43,13 +73,13 @@ def get_system_metrics():
     cpu_percent = psutil.cpu_percent(interval=None)
     memory_info = psutil.virtual_memory()
     process_memory = get_process_memory()
-    disk_usage = psutil.disk_usage("/")
+    disk_usage = get_disk_usage()
     system_load = psutil.getloadavg()
 
     return {
         "cpu": cpu_percent,
         "memory_percent": memory_info.percent,
-        "memory_total": round(memory_info.total / (1024**3), 2),
+        "memory_total": MEMORY_TOTAL_GB,
         "memory_used": round(memory_info.used / (1024**3), 2),
         "process_memory": round(process_memory / (1024**2), 2),
         "disk_percent": disk_usage.percent,
@@ -57,6 +87,32 @@ def get_system_metrics():
     }
 
 
+def publish_system_metrics():
+    """Refresh the shared metrics snapshot while any console client is connected."""
+    if _metrics_subscribers:
+        _metrics_cache["value"] = collect_system_metrics()
+    else:
+        # Keep the CPU baseline recent so the next client doesn't get an average
+        # over the whole idle period
+        psutil.cpu_percent(interval=None)
+
+
+def get_system_metrics() -> dict:
+    """
+    Return the latest shared metrics snapshot.
+
+    The snapshot is refreshed by a single application-wide timer, so any number of
+    connected console clients cause one probe per tick.
+    """
+    if _metrics_cache["value"] is None:
+        _metrics_cache["value"] = collect_system_metrics()
+    return _metrics_cache["value"]
+
+
+# One application-wide publisher shared by every console client
+app.timer(METRICS_INTERVAL, publish_system_metrics)
+
+
 @router.page("/")
 @require_user(superuser=True)
 async def console_page(request: Request, client: Client):
@@ -108,7 +164,16 @@ async def console_page(request: Request, client: Client):
                 ui.button(
                     _("Show object count"),
                     on_click=lambda: notify.info(
-                        _("Object count: {count}").format(count=len(gc.get_objects()))
+                        _(
+                            "Allocated memory blocks: {blocks}, "
+                            "pending GC objects per generation: {pending}, "
+                            "GC collections: {collections}"
+                        ).format(
+                            # Cheap counters; gc.get_objects() would copy every tracked object
+                            blocks=sys.getallocatedblocks(),
+                            pending=gc.get_count(),
+                            collections=sum(s["collections"] for s in gc.get_stats()),
+                        )
                     ),
                 )
 
@@ -158,60 +223,119 @@ async def console_page(request: Request, client: Client):
                 app.storage.browser.clear()
                 app.storage.browser.update(data)
 
-            with ui.column().classes("w-full"):
-                ui.label(_("Global storage")).classes("font-bold")
-                ui.json_editor(
-                    {"content": {"json": app.storage.general}},
-                    on_change=on_app_storage_general_change,
-                ).classes("w-full").style(style)
-
-                ui.label(_("User storage")).classes("font-bold")
-                ui.json_editor(
-                    {"content": {"json": app.storage.user}},
-                    on_change=on_app_storage_user_change,
-                ).classes("w-full").style(style)
-
-                ui.label(_("Client storage")).classes("font-bold")
-                ui.json_editor(
-                    {"content": {"json": app.storage.client}},
-                    on_change=on_app_storage_client_change,
-                ).classes("w-full").style(style)
-
-                ui.label(_("Browser storage")).classes("font-bold")
-                ui.json_editor(
-                    {"content": {"json": app.storage.browser}},
-                    on_change=on_app_storage_browser_change,
-                ).classes("w-full").style(style)
-
-        # Periodic metrics updater
-        def update_metrics():
-            metrics = get_system_metrics()
+            def lazy_json_editor(title: str, storage: dict, on_change):
+                """Render a collapsed panel that builds its JSON editor on first expand."""
+                editor = None
+
+                def on_expand(e):
+                    nonlocal editor
+                    if e.value and editor is None:
+                        with expansion:
+                            editor = (
+                                ui.json_editor(
+                                    {"content": {"json": storage}},
+                                    on_change=on_change,
+                                )
+                                .classes("w-full")
+                                .style(style)
+                            )
+
+                expansion = (
+                    ui.expansion(title, on_value_change=on_expand)
+                    .classes("w-full")
+                    .props('header-class="font-bold"')
+                )
 
-            cpu_progress.value = round(metrics["cpu"] / 100, 2)
-            memory_progress.value = round(metrics["memory_percent"] / 100, 2)
-            disk_progress.value = round(metrics["disk_percent"] / 100, 2)
+            with ui.column().classes("w-full"):
+                lazy_json_editor(
+                    _("Global storage"),
+                    app.storage.general,
+                    on_app_storage_general_change,
+                )
+                lazy_json_editor(
+                    _("User storage"),
+                    app.storage.user,
+                    on_app_storage_user_change,
+                )
+                lazy_json_editor(
+                    _("Client storage"),
+                    app.storage.client,
+                    on_app_storage_client_change,
+                )
+                lazy_json_editor(
+                    _("Browser storage"),
+                    app.storage.browser,
+                    on_app_storage_browser_change,
+                )
 
-            process_memory_label.text = _("{app_name} memory usage: {value} MB").format(
-                app_name=settings.APP_NAME,
-                value=metrics["process_memory"],
-            )
+        # Periodic metrics updater: only push values that actually changed
+        last_metrics = {}
+        idle_ticks = 0
 
-            system_load_label.text = _("Host load average: {a} {b} {c}").format(
-                a=f"{metrics['system_load'][0]:.2f}",
-                b=f"{metrics['system_load'][1]:.2f}",
-                c=f"{metrics['system_load'][2]:.2f}",
-            )
+        def update_metrics():
+            nonlocal idle_ticks
+            metrics = get_system_metrics()
 
-            cpu_progress.update()
-            memory_progress.update()
-            disk_progress.update()
-            system_load_label.update()
+            progress_values = {
+                cpu_progress: round(metrics["cpu"] / 100, 2),
+                memory_progress: round(metrics["memory_percent"] / 100, 2),
+                disk_progress: round(metrics["disk_percent"] / 100, 2),
+            }
+            label_texts = {
+                process_memory_label: _("{app_name} memory usage: {value} MB").format(
+                    app_name=settings.APP_NAME,
+                    value=metrics["process_memory"],
+                ),
+                system_load_label: _("Host load average: {a} {b} {c}").format(
+                    a=f"{metrics['system_load'][0]:.2f}",
+                    b=f"{metrics['system_load'][1]:.2f}",
+                    c=f"{metrics['system_load'][2]:.2f}",
+                ),
+            }
+
+            # Setting value/text triggers an update, so skip unchanged widgets
+            is_quiet = True
+            for progress, value in progress_values.items():
+                last_value = last_metrics.get(progress)
+                if last_value == value:
+                    continue
+                if (
+                    last_value is None
+                    or abs(value - last_value) > METRICS_CHANGE_THRESHOLD
+                ):
+                    is_quiet = False
+                progress.value = value
+                last_metrics[progress] = value
+
+            for label, text in label_texts.items():
+                if last_metrics.get(label) != text:
+                    label.text = text
+                    last_metrics[label] = text
+
+            # Adaptive backoff: slow down while idle, reset on meaningful change
+            if is_quiet:
+                idle_ticks += 1
+                if idle_ticks >= METRICS_IDLE_TICKS:
+                    update_metrics_timer.interval = min(
+                        update_metrics_timer.interval * 2, METRICS_MAX_INTERVAL
+                    )
+                    idle_ticks = 0
+            else:
+                idle_ticks = 0
+                update_metrics_timer.interval = METRICS_INTERVAL
 
-        update_metrics_timer = ui.timer(2.0, update_metrics)
+        _metrics_subscribers.add(client.id)
+        update_metrics_timer = ui.timer(METRICS_INTERVAL, update_metrics)
+        # Fill the widgets now instead of leaving them blank until the first tick
+        update_metrics()
 
         @ui.context.client.on_delete
         def disconnect():
             """Clean up the periodic timer when the client disconnects."""
+            _metrics_subscribers.discard(client.id)
+            if not _metrics_subscribers:
+                # Nobody refreshes the snapshot now; the next client probes afresh
+                _metrics_cache["value"] = None
             update_metrics_timer.deactivate()
             update_metrics_timer.cancel()
             update_metrics_timer.delete()
@@ -15,14 +15,11 @@ from app.utils.platform import detect_platform
 this_page_routes = "/login"
 
 
-@app.get(this_page_routes)
-def login_index():
-    """Redirect the base login route to its index page."""
-    return RedirectResponse(f"{this_page_routes}/")
-
-
 router = APIRouter(prefix=this_page_routes)
 
+# Seconds between email format checks while the user is typing
+EMAIL_VALIDATION_THROTTLE = 0.25
+
 
 @router.page("/")
 async def login_page(redirect_to: str | None = None):
@@ -32,27 +29,18 @@ async def login_page(redirect_to: str | None = None):
     If the user is already authenticated, they are redirected to the home page (or the provided 'redirect_to' URL).
     Otherwise, a login form with email and password fields is displayed.
     """
+    user_manager = globals.get_user_manager()
+
+    # Early redirect if already logged in, before any of the page is built
+    if await user_manager.is_login():
+        app.storage.user["flash"] = _("You are already signed in")
+        return RedirectResponse(redirect_to or "/home")
+
     async with BaseLayout().render(
         header=False,
         footer=True,
         args={"from_login_page": True},
     ):
-        user_manager = globals.get_user_manager()
-
-        def redirect():
-            """Redirect the user after successful login."""
-            ui.timer(
-                settings.NICEGUI_TIMER_INTERVAL,
-                lambda: ui.navigate.to(redirect_to or "/home"),
-                once=True,
-            )
-
-        # Early redirect if already logged in
-        if await user_manager.is_login():
-            notify.success(_("You are already signed in"))
-            redirect()
-            return
-
         # Login form UI
         with (
             ui.card(align_items="center")
@@ -71,6 +59,9 @@ async def login_page(redirect_to: str | None = None):
 
             async def try_login():
                 """Attempt to log in the user with the provided credentials."""
+                if not email.validate():
+                    return
+
                 credentials = UserLogin(
                     email=email.value,
                     password=password.value,
@@ -85,8 +76,6 @@ async def login_page(redirect_to: str | None = None):
                     notify.warning(_("Account not found"))
                     return
 
-                notify.success(_("Signed in successfully"))
-
                 # Store user's timezone from browser
                 user_timezone = await get_user_timezone_from_browser()
                 app.storage.user.update({"timezone": user_timezone})
@@ -100,18 +89,28 @@ async def login_page(redirect_to: str | None = None):
                     }
                 )
 
-                redirect()
+                # Navigate right away; the next page shows the message
+                app.storage.user["flash"] = _("Signed in successfully")
+                ui.navigate.to(redirect_to or "/home")
 
             with ui.column().classes("w-full gap-0"):
-                # Email input with validation
+                # Email input, validated at most every EMAIL_VALIDATION_THROTTLE seconds
                 email = (
                     ui.input(
                         _("Email"),
-                        validation=lambda value: (
-                            None
-                            if is_valid_email(value)
-                            else _("Invalid email address")
-                        ),
+                        validation={
+                            _("Invalid email address"): lambda value: is_valid_email(
+                                value or ""
+                            )
+                        },
+                    )
+                    # Keep the error until the next throttled check instead of
+                    # clearing it on every keystroke
+                    .without_auto_validation()
+                    .on(
+                        "update:model-value",
+                        lambda: email.validate(),
+                        throttle=EMAIL_VALIDATION_THROTTLE,
                     )
                     .on("keyup.enter", try_login)
                     .classes("w-full")
@@ -1,9 +1,8 @@
-from fastapi.responses import RedirectResponse
 from nicegui import ui, APIRouter, app
 
 from app import globals
 from app.config import settings
-from app.core.i18n import _, APP_DEFAULT_LANGUAGE, SUPPORTED_LANGUAGES_MAP
+from app.core.i18n import _, APP_DEFAULT_LANGUAGE, get_supported_languages_map
 from app.schemas.user_schema import UserModifyPassword
 from app.security.guards import require_user
 from app.ui.components import max_w
@@ -14,11 +13,6 @@ from app.ui.components.notify import notify
 this_page_routes = "/account"
 
 
-@app.get(this_page_routes)
-def browser_index():
-    return RedirectResponse(this_page_routes + "/")
-
-
 router = APIRouter(prefix=this_page_routes)
 
 
@@ -64,7 +58,7 @@ async def index():
                 ui.label(_("Language")).classes("text-sm text-gray-500 mb-2")
 
                 language_select = ui.select(
-                    options=SUPPORTED_LANGUAGES_MAP,
+                    options=get_supported_languages_map(),
                     value=current_lang,
                 ).classes("w-full")
 
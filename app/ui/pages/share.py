@@ -1,10 +1,10 @@
+import asyncio
 from pathlib import Path
 from typing import Annotated, Callable
 
 from fastapi import Depends
 from nicegui import ui, app, APIRouter
 from starlette.requests import Request
-from starlette.responses import RedirectResponse
 
 from app import globals
 from app.core.i18n import _
@@ -23,12 +23,6 @@ from app.utils.time import timestamp_to_human_readable, datetime_to_human_readab
 this_page_routes = "/share"
 
 
-@app.get(this_page_routes)
-def browser_index():
-    """Redirect the base share route to its index page."""
-    return RedirectResponse(f"{this_page_routes}/")
-
-
 router = APIRouter(prefix=this_page_routes)
 
 
@@ -77,7 +71,14 @@ async def index(
         footer=True,
         args={"title": _("Share")},
     ):
-        size_ui = {"label": None, "btn": None}
+        size_ui = {"label": None, "btn": None, "task": None}
+
+        @ui.context.client.on_delete
+        def cancel_size_calculation():
+            """Stop an in-progress directory size walk when the client goes away."""
+            task = size_ui.get("task")
+            if task and not task.done():
+                task.cancel()
 
         file_info: FileMetadata | DirMetadata = file_manager.get_file_metadata(
             validated_data.path
@@ -124,10 +125,20 @@ async def index(
 
             label.text = _("Calculating…")
             btn.disable()
+            # Keep a handle so the walk is cancelled if the visitor leaves the page
+            size_ui["task"] = asyncio.current_task()
+            total_size = 0
             try:
-                total_size = await file_manager.get_directory_size(file_info.path)
+                async for total_size in file_manager.iter_directory_size(
+                    file_info.path
+                ):
+                    # Running totals are partial until the walk finishes
+                    label.text = _("{size} (calculating…)").format(
+                        size=bytes_to_human_readable(total_size)
+                    )
                 label.text = bytes_to_human_readable(total_size)
             finally:
+                size_ui["task"] = None
                 btn.enable()
 
         async def on_browse_button_click():
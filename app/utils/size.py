@@ -1,3 +1,10 @@
+import math
+from functools import lru_cache
+
+SIZE_UNITS = ("Bytes", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
+
+
+@lru_cache(maxsize=4096)
 def bytes_to_human_readable(num_bytes: int) -> str:
     """
     Convert a number of bytes into a human-readable string representation.
@@ -6,8 +13,10 @@ def bytes_to_human_readable(num_bytes: int) -> str:
     unit (from bytes up to yottabytes), providing a readable format with two
     decimal places precision.
     """
-    for unit in ["Bytes", "KB", "MB", "GB", "TB", "PB", "EB", "ZB"]:
-        if num_bytes < 1024.0:
-            return f"{num_bytes:.2f} {unit}"
-        num_bytes /= 1024.0
-    return f"{num_bytes:.2f} YB"
+    if num_bytes <= 0:
+        return f"{num_bytes:.2f} {SIZE_UNITS[0]}"
+    # Each unit is 2**10 larger, so the unit index follows from the binary exponent.
+    # frexp works on the float value, which keeps e.g. 2**70 - 1 (a float 2**70)
+    # at "1.00 ZB" as the old divide-by-1024 loop did.
+    index = max(0, min((math.frexp(num_bytes)[1] - 1) // 10, len(SIZE_UNITS) - 1))
+    return f"{num_bytes / (1 << (index * 10)):.2f} {SIZE_UNITS[index]}"
@@ -1,7 +1,11 @@
 from datetime import datetime, timezone
+from functools import lru_cache
 
 from app.config import settings
 
+# Fixed for the lifetime of the process; read once instead of per call
+DEFAULT_TIMEZONE = settings.SYSTEM_DEFAULT_TIMEZONE
+
 
 def utc_now() -> datetime:
     """Return the current time as an aware datetime object in UTC."""
@@ -20,6 +24,7 @@ def ensure_utc(dt: datetime) -> datetime:
     return dt.astimezone(timezone.utc)
 
 
+@lru_cache(maxsize=4096)
 def timestamp_to_human_readable(timestamp: float, tz=None) -> str:
     """
     Convert a Unix timestamp to a human-readable date and time string.
@@ -30,9 +35,9 @@ def timestamp_to_human_readable(timestamp: float, tz=None) -> str:
     """
     if not timestamp:
         return "None"
-    return datetime.fromtimestamp(
-        timestamp, tz=tz or settings.SYSTEM_DEFAULT_TIMEZONE
-    ).strftime("%Y-%m-%d %H:%M:%S %Z")
+    dt = datetime.fromtimestamp(timestamp, tz=tz or DEFAULT_TIMEZONE)
+    # isoformat() is implemented in C; drop its UTC offset and append the zone name
+    return f"{dt.isoformat(sep=' ', timespec='seconds')[:19]} {dt.tzname() or ''}"
 
 
 def datetime_to_human_readable(dt: datetime, tz=None) -> str:
@@ -45,6 +50,4 @@ def datetime_to_human_readable(dt: datetime, tz=None) -> str:
     """
     if not dt:
         return "None"
-    return dt.astimezone(tz or settings.SYSTEM_DEFAULT_TIMEZONE).strftime(
-        "%Y-%m-%d %H:%M:%S %Z"
-    )
+    return dt.astimezone(tz or DEFAULT_TIMEZONE).strftime("%Y-%m-%d %H:%M:%S %Z")
@@ -0,0 +1,184 @@
+import asyncio
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from app.config import settings
+from app.schemas.file_schema import DirMetadata
+from app.services import file_service
+from app.services.file_service import StorageManager
+from app.storage.local_storage import LocalStorage
+
+TEST_BACKEND_NAME = "TestLocalStorage"
+
+# An mtime well in the past, so any later change to the directory moves it
+OLD_MTIME_NS = 1_000_000_000
+
+
+@pytest.fixture
+def storage_root(tmp_path):
+    """A small directory tree: three files, one subdirectory and a hidden file."""
+    (tmp_path / "b.txt").write_bytes(b"x" * 30)
+    (tmp_path / "A.md").write_bytes(b"x" * 10)
+    (tmp_path / "c").write_bytes(b"x" * 20)
+    (tmp_path / "zdir").mkdir()
+    (tmp_path / ".hidden").write_bytes(b"x")
+    os.utime(tmp_path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+    return tmp_path
+
+
+@pytest.fixture
+def manager(storage_root):
+    """A StorageManager whose current backend is a LocalStorage on storage_root."""
+    manager = StorageManager()
+    manager.register_backend(TEST_BACKEND_NAME, LocalStorage(str(storage_root)))
+    manager.set_current_backend(TEST_BACKEND_NAME)
+    return manager
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the monotonic clock used by the listing cache with a settable one."""
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(
+        file_service, "time", SimpleNamespace(monotonic=lambda: now.value)
+    )
+    return now
+
+
+def names(entries) -> list[str]:
+    return [entry.name for entry in entries]
+
+
+class TestListFilesCache:
+
+    def test_repeat_listing_is_served_from_cache(self, manager, mocker, clock):
+        backend = manager._get_current_backend()
+        spy = mocker.spy(backend, "list_files")
+
+        first = manager.list_files(".")
+        second = manager.list_files(".")
+
+        assert second is first
+        assert spy.call_count == 1
+
+    def test_listing_expires_after_ttl(self, manager, mocker, clock):
+        backend = manager._get_current_backend()
+        spy = mocker.spy(backend, "list_files")
+
+        manager.list_files(".")
+        clock.value += settings.LIST_FILES_CACHE_TTL + 1
+        manager.list_files(".")
+
+        assert spy.call_count == 2
+
+    def test_mutation_invalidates_listing(self, manager, clock):
+        manager.list_files(".")
+
+        manager.create_directory("new_dir")
+
+        assert "new_dir" in names(manager.list_files("."))
+
+    def test_failed_mutation_still_invalidates_listing(self, manager, mocker, clock):
+        backend = manager._get_current_backend()
+        manager.list_files(".")
+        mocker.patch.object(backend, "delete_file", side_effect=OSError("boom"))
+
+        with pytest.raises(OSError):
+            manager.delete_file("b.txt")
+
+        assert manager._list_cache == {}
+
+    def test_out_of_band_change_is_picked_up(self, manager, storage_root, clock):
+        manager.list_files(".")
+
+        # Written straight to disk, bypassing the manager
+        (storage_root / "d.txt").write_bytes(b"x")
+
+        assert "d.txt" in names(manager.list_files("."))
+
+    def test_listing_racing_a_mutation_is_not_cached(self, manager, mocker, clock):
+        backend = manager._get_current_backend()
+        list_files = backend.list_files
+
+        def list_files_during_mutation(remote_path):
+            entries = list_files(remote_path)
+            manager.invalidate_list_cache()
+            return entries
+
+        mocker.patch.object(backend, "list_files", list_files_during_mutation)
+        manager.list_files(".")
+
+        assert manager._list_cache == {}
+
+
+class TestListFilesPage:
+
+    def list_page(self, manager, **kwargs):
+        return asyncio.run(manager.list_files_page(".", **kwargs))
+
+    def test_hidden_entries_are_skipped(self, manager):
+        entries, total = self.list_page(manager, sort_by="name")
+
+        assert total == 4
+        assert ".hidden" not in names(entries)
+
+    def test_sort_by_name_is_case_insensitive(self, manager):
+        entries, _total = self.list_page(manager, sort_by="name")
+
+        assert names(entries) == ["A.md", "b.txt", "c", "zdir"]
+
+    def test_sort_by_type_lists_directories_first(self, manager):
+        entries, _total = self.list_page(manager, sort_by="type")
+
+        assert isinstance(entries[0], DirMetadata)
+        assert names(entries)[0] == "zdir"
+        assert sorted(names(entries)[1:]) == ["A.md", "b.txt", "c"]
+
+    def test_sort_by_extension(self, manager):
+        entries, _total = self.list_page(manager, sort_by="extension")
+
+        assert names(entries)[-2:] == ["A.md", "b.txt"]
+
+    def test_sort_by_size_keeps_directories_first(self, manager):
+        entries, _total = self.list_page(manager, sort_by="size")
+
+        assert names(entries) == ["zdir", "A.md", "c", "b.txt"]
+
+    def test_sort_descending(self, manager):
+        entries, _total = self.list_page(manager, sort_by="size", descending=True)
+
+        assert names(entries) == ["b.txt", "c", "A.md", "zdir"]
+
+    @pytest.mark.parametrize("sort_by", ["name", "size"])
+    def test_window_is_sliced_after_sorting(self, manager, sort_by):
+        full, _total = self.list_page(manager, sort_by=sort_by)
+
+        entries, total = self.list_page(manager, offset=1, limit=2, sort_by=sort_by)
+
+        assert total == 4
+        assert names(entries) == names(full)[1:3]
+
+    def test_limit_zero_returns_the_rest(self, manager):
+        entries, total = self.list_page(manager, offset=3, limit=0, sort_by="name")
+
+        assert total == 4
+        assert names(entries) == ["zdir"]
+
+    def test_window_metadata_matches_full_listing(self, manager):
+        entries, _total = self.list_page(manager, sort_by="name")
+
+        listed = {entry.name: entry for entry in manager.list_files(".")}
+        for entry in entries:
+            assert entry == listed[entry.name]
+
+    def test_only_the_window_is_statted_for_name_sorts(self, manager, mocker):
+        backend = manager._get_current_backend()
+        list_spy = mocker.spy(backend, "list_files")
+        metadata_spy = mocker.spy(backend, "get_children_metadata")
+
+        self.list_page(manager, offset=0, limit=2, sort_by="name")
+
+        list_spy.assert_not_called()
+        assert metadata_spy.call_args.args == (".", ["A.md", "b.txt"])
@@ -0,0 +1,26 @@
+import pytest
+
+from app.utils.size import bytes_to_human_readable
+
+
+@pytest.mark.parametrize(
+    "num_bytes, expected",
+    [
+        (0, "0.00 Bytes"),
+        (-1, "-1.00 Bytes"),
+        (0.5, "0.50 Bytes"),
+        (1023, "1023.00 Bytes"),
+        (1024, "1.00 KB"),
+        (1536, "1.50 KB"),
+        (2**20 - 1, "1024.00 KB"),
+        (2**20, "1.00 MB"),
+        (2**60, "1.00 EB"),
+        # Rounds to the float 2**70, as the old divide-by-1024 loop did
+        (2**70 - 1, "1.00 ZB"),
+        (2**80, "1.00 YB"),
+        # Nothing above yottabytes
+        (2**90, "1024.00 YB"),
+    ],
+)
+def test_bytes_to_human_readable(num_bytes, expected):
+    assert bytes_to_human_readable(num_bytes) == expected
@@ -0,0 +1,41 @@
+import errno
+
+import pytest
+
+from app.storage.base import StorageError, StoragePermissionError
+from app.ui.components.table import is_transient_upload_error
+
+
+def raised_from(exc: BaseException, cause: BaseException) -> BaseException:
+    exc.__cause__ = cause
+    return exc
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        TimeoutError(),
+        ConnectionResetError(),
+        OSError(errno.EAGAIN, "Resource temporarily unavailable"),
+        OSError(errno.EBUSY, "Device or resource busy"),
+        raised_from(StorageError("upload failed"), TimeoutError()),
+    ],
+)
+def test_transient_errors_are_retried(exc):
+    assert is_transient_upload_error(exc)
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        ValueError(),
+        StorageError("upload failed"),
+        PermissionError(errno.EACCES, "Permission denied"),
+        OSError(errno.ENOSPC, "No space left on device"),
+        StoragePermissionError("denied"),
+        # A permission failure is final even if it wraps a transient one
+        raised_from(StoragePermissionError("denied"), TimeoutError()),
+    ],
+)
+def test_permanent_errors_are_not_retried(exc):
+    assert not is_transient_upload_error(exc)